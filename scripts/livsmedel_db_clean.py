@@ -1,15 +1,11 @@
-import pandas as pd
-import numpy as np
-
 import os
+import re
 
 # 1. Ladda in din fil (Justera filnamnet om det behövs)
 # Använd nuvarande mapps sökväg för att hitta filen
 current_dir = os.path.dirname(os.path.abspath(__file__))
 input_filename = os.path.join(current_dir, 'livsmedel.xlsx')
-
-# Läs in Excel-filen (kräver 'openpyxl' installerat)
-df = pd.read_excel(input_filename, skiprows=2)
+cache_filename = os.path.join(current_dir, 'livsmedel.feather')
 
 # 2. Välj ut de kolumner du vill ha till din app (Datamodellen)
 # Vi döper om dem till engelska direkt för att underlätta kodning
@@ -37,13 +33,7 @@ columns_to_keep = {
     'Linolsyra C18:2 (g)': 'Omega6'
 }
 
-df_clean = df[list(columns_to_keep.keys())].copy()
-df_clean.rename(columns=columns_to_keep, inplace=True)
-
 # 3. Logik för att identifiera Veganskt (True/False)
-# Standardvärde: Allt är veganskt tills motsatsen bevisats
-df_clean['IsVegan'] = True
-
 # A. Filtrera på Kategori (Gruppering)
 non_vegan_categories = [
     'Kött', 'Fisk', 'Fågel', 'Ägg', 'Mjölk', 'Ost', 'Grädde', 'Smör', 
@@ -65,46 +55,120 @@ vegan_exceptions = [
     'valnöt', 'hassel', 'pecan', 'pista', 'macadamia', 'para', 'kokosfett'
 ]
 
-def is_not_vegan(row):
-    name = str(row['Name']).lower()
-    category = str(row['Category']).lower()
-    cholesterol = row['Cholesterol']
+def read_excel_columns(filename, columns, header_row):
+    # Strömmar arket rad för rad (read_only) och plockar bara ut de kolumner vi
+    # behåller, i stället för att låta pandas bygga hela arket i minnet först
+    import openpyxl
+    import pandas as pd
+
+    wb = openpyxl.load_workbook(filename, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(min_row=header_row, values_only=True)
+        header = next(rows)
+        indices = [header.index(col) for col in columns]
+        data = {col: [] for col in columns}
+
+        for row in rows:
+            if all(cell is None for cell in row):
+                continue
+            for col, i in zip(columns, indices):
+                value = row[i] if i < len(row) else None
+                # Samma som read_excel: heltal lagrade som flyttal blir int
+                if isinstance(value, float) and value.is_integer():
+                    value = int(value)
+                data[col].append(value)
+    finally:
+        wb.close()
+
+    return pd.DataFrame(data)
+
+def read_cache(cache_filename, source_filename, columns):
+    # Cachen innehåller bara de kolumner som lästes in sist, så den gäller
+    # bara om Excel-filen är oförändrad och alla efterfrågade kolumner finns
+    import pandas as pd
+
+    if not os.path.exists(cache_filename) or os.path.getmtime(cache_filename) < os.path.getmtime(source_filename):
+        return None
+    try:
+        df = pd.read_feather(cache_filename)
+    except Exception as e:
+        print(f"Kunde inte läsa cachen ({e}), läser om Excel-filen")
+        return None
+    if not set(columns) <= set(df.columns):
+        return None
+    return df
+
+def write_cache(df, cache_filename):
+    # Skriv till en temporär fil och byt sedan plats, så att ett avbrutet skriv
+    # aldrig lämnar en trasig cache som ser nyare ut än Excel-filen. Cachen är
+    # frivillig, så alla fel här ska bara leda till att vi kör utan den
+    tmp_filename = cache_filename + '.tmp'
+    try:
+        df.to_feather(tmp_filename)
+        os.replace(tmp_filename, cache_filename)
+    except Exception as e:
+        print(f"Kunde inte spara cachen ({e}), fortsätter utan")
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+
+def contains_any(series, words):
+    pattern = '|'.join(re.escape(w.lower()) for w in words)
+    return series.str.contains(pattern, regex=True, na=False)
+
+def is_vegan(df_clean):
+    # Vektoriserad variant: varje kolumn sänks till gemener en gång och skannas
+    # med en sammanslagen regex i stället för en Python-loop per rad
+    name = df_clean['Name'].astype(str).str.lower()
+    category = df_clean['Category'].astype(str).str.lower()
 
     # Regel 1: Kolesterol finns nästan bara i animaliska produkter
-    if cholesterol > 0:
-        return True
+    has_cholesterol = df_clean['Cholesterol'] > 0
 
     # Regel 2: Kategorier som alltid är icke-veganska
-    for cat in non_vegan_categories:
-        if cat.lower() in category:
-            return True
-
-    # Regel 3: Nyckelord i namnet
-    for keyword in non_vegan_keywords:
-        if keyword in name:
-            # Kontrollera undantag (t.ex. "Kokosmjölk", "Jordnöt")
-            is_exception = False
-            for exc in vegan_exceptions:
-                if exc in name:
-                    is_exception = True
-                    break
-            
-            # Specialfall för "nöt": Om det är "nöt" (biff) men namnet innehåller "nötter" (nuts)
-            if keyword == 'nöt' and ('nötter' in category or 'frö' in category):
-                is_exception = True
-
-            if not is_exception:
-                return True
-                
-    return False
-
-# Applicera logiken
-df_clean['IsVegan'] = ~df_clean.apply(is_not_vegan, axis=1)
-
-# 4. Spara till ny CSV
-output_filename = 'LivsmedelsDB_Cleaned_Vegan.csv'
-df_clean.to_csv(output_filename, index=False)
-
-print(f"Klar! Filen sparad som: {output_filename}")
-print(f"Antal veganska produkter: {df_clean['IsVegan'].sum()}")
-print(df_clean[['Name', 'Category', 'IsVegan']].head(10))
\ No newline at end of file
+    bad_category = contains_any(category, non_vegan_categories)
+
+    # Regel 3: Nyckelord i namnet, med undantag (t.ex. "Kokosmjölk", "Jordnöt")
+    is_exception = contains_any(name, vegan_exceptions)
+
+    # Specialfall för "nöt": Om det är "nöt" (biff) men kategorin innehåller "nötter" (nuts)
+    nut_category = category.str.contains('nötter|frö', regex=True, na=False)
+    bad_nut = contains_any(name, ['nöt']) & ~nut_category
+    bad_keyword = contains_any(name, [kw for kw in non_vegan_keywords if kw != 'nöt'])
+
+    not_vegan = has_cholesterol | bad_category | ((bad_keyword | bad_nut) & ~is_exception)
+
+    return ~not_vegan
+
+def main():
+    # pandas importeras här så att listorna och hjälpfunktionerna ovan kan
+    # importeras (t.ex. i tester) utan att betala för pandas-importen
+    import pandas as pd
+
+    # Läs in Excel-filen (kräver 'openpyxl' installerat). Att tolka xlsx är det
+    # klart långsammaste steget, så resultatet cachas som Feather (kräver 'pyarrow')
+    # och återanvänds så länge Excel-filen inte har ändrats
+    df = read_cache(cache_filename, input_filename, list(columns_to_keep))
+    if df is None:
+        df = read_excel_columns(input_filename, list(columns_to_keep), header_row=3)
+        write_cache(df, cache_filename)
+
+    df_clean = df[list(columns_to_keep)].rename(columns=columns_to_keep)
+
+    # Näringsvärdena räcker gott med float32, vilket halverar minnet som skannas
+    # (heltalskolumner lämnas orörda så att CSV-formatet inte ändras)
+    float_columns = df_clean.select_dtypes('float64').columns
+    df_clean[float_columns] = df_clean[float_columns].astype('float32')
+
+    # Applicera logiken
+    df_clean['IsVegan'] = is_vegan(df_clean)
+
+    # 4. Spara till ny CSV
+    output_filename = 'LivsmedelsDB_Cleaned_Vegan.csv'
+    df_clean.to_csv(output_filename, index=False)
+
+    print(f"Klar! Filen sparad som: {output_filename}")
+    print(f"Antal veganska produkter: {df_clean['IsVegan'].sum()}")
+    print(df_clean[['Name', 'Category', 'IsVegan']].head(10))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+from contextlib import contextmanager
+from playwright.sync_api import sync_playwright
+
+@contextmanager
+def shared_browser():
+    # Launch Chromium once; each verification flow creates its own context
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            yield browser
+        finally:
+            browser.close()
@@ -0,0 +1,14 @@
+from _runner import shared_browser
+from verify_dashboard_quick import verify_dashboard_quick
+
+# Usage: python verification/run_all.py
+FLOWS = [verify_dashboard_quick]
+
+def run():
+    with shared_browser() as browser:
+        for flow in FLOWS:
+            print(f"Running {flow.__name__}...")
+            flow(browser)
+
+if __name__ == "__main__":
+    run()